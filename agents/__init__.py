@@ -4,6 +4,8 @@ OpenSource Sensei Agents Package
 This package contains all the specialized AI agents for guiding code contributors.
 """
 
+from importlib import import_module
+
 from .base_agent import (
     BaseAgent,
     AgentOrchestrator,
@@ -13,8 +15,13 @@ from .base_agent import (
     MessageType,
     TaskResult
 )
-from .research_agent import ResearchAgent
-from .qa_agent import QAAgent
+
+# Concrete agents pull in their own dependencies (aiohttp for research), so
+# they load on first access instead of with every `agents.*` import
+_LAZY_AGENTS = {
+    "ResearchAgent": ".research_agent",
+    "QAAgent": ".qa_agent",
+}
 
 __all__ = [
     "BaseAgent",
@@ -26,4 +33,13 @@ __all__ = [
     "TaskResult",
     "ResearchAgent",
     "QAAgent"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_AGENTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Dict, List, Any, Optional, Callable, TYPE_CHECKING, Tuple, Set, Union
+from typing import Dict, List, Any, Optional, Callable, TYPE_CHECKING, Tuple, Set, Union, Deque
 from pydantic import BaseModel, Field
 from datetime import datetime
 import asyncio
@@ -9,9 +9,11 @@ import logging
 import os
 import sys
 import tempfile
+import time
 import shutil
 from pathlib import Path
 from dataclasses import dataclass, field
+from collections import deque
 
 if TYPE_CHECKING:
     from .base_agent import AgentOrchestrator
@@ -37,7 +39,7 @@ class MessageType(str, Enum):
     DATA_REQUEST = "data_request"
     DATA_RESPONSE = "data_response"
 
-@dataclass
+@dataclass(slots=True)
 class AgentMessage:
     """Message structure for inter-agent communication"""
     id: str
@@ -114,7 +116,7 @@ class BaseAgent(ABC):
         try:
             start_time = datetime.now()
             self.status = AgentStatus.BUSY
-            self.last_activity = datetime.now()
+            self.last_activity = start_time
             
             result = await self.process_task(message.content)
             
@@ -131,7 +133,7 @@ class BaseAgent(ABC):
                 recipient_id=message.sender_id,
                 message_type=MessageType.RESPONSE,
                 content={"result": result, "success": True},
-                timestamp=datetime.now(),
+                timestamp=end_time,
                 correlation_id=message.correlation_id
             )
         except Exception as e:
@@ -154,19 +156,20 @@ class BaseAgent(ABC):
     async def _handle_collaboration(self, message: AgentMessage) -> Optional[AgentMessage]:
         """Handle collaboration requests from other agents"""
         # Override in subclasses for specific collaboration logic
-        logger.info(f"Agent {self.agent_id} received collaboration request from {message.sender_id}")
+        logger.debug("Agent %s received collaboration request from %s", self.agent_id, message.sender_id)
         self.last_activity = datetime.now()
         return None
     
     async def _handle_status_update(self, message: AgentMessage) -> None:
         """Handle status update messages"""
-        logger.info(f"Agent {self.agent_id} received status update: {message.content}")
+        logger.debug("Agent %s received status update: %s", self.agent_id, message.content)
         self.last_activity = datetime.now()
     
     async def _handle_data_request(self, message: AgentMessage) -> AgentMessage:
         """Handle data request messages from other agents"""
-        logger.info(f"Agent {self.agent_id} received data request from {message.sender_id}")
-        self.last_activity = datetime.now()
+        logger.debug("Agent %s received data request from %s", self.agent_id, message.sender_id)
+        now = datetime.now()
+        self.last_activity = now
         
         # Default implementation returns empty data
         # Override in subclasses for specific data handling
@@ -176,35 +179,29 @@ class BaseAgent(ABC):
             recipient_id=message.sender_id,
             message_type=MessageType.DATA_RESPONSE,
             content={"data": {}, "success": True},
-            timestamp=datetime.now(),
+            timestamp=now,
             correlation_id=message.correlation_id
         )
     
     async def _handle_notification(self, message: AgentMessage) -> None:
         """Handle notification messages"""
-        logger.info(f"Agent {self.agent_id} received notification: {message.content}")
+        logger.debug("Agent %s received notification: %s", self.agent_id, message.content)
         self.last_activity = datetime.now()
     
     def _update_performance_metrics(self, success: bool, processing_time: float) -> None:
         """Update agent performance metrics"""
-        self.performance_metrics["tasks_completed"] += 1
+        metrics = self.performance_metrics
+        completed = metrics["tasks_completed"] + 1
+        metrics["tasks_completed"] = completed
         
+        # Incremental (Welford-style) running means: mean += (x - mean) / n.
+        # Avoids rebuilding totals from mean * count, which drifts over long runs
         if success:
-            # Update success rate
-            current_success = self.performance_metrics["success_rate"] * (self.performance_metrics["tasks_completed"] - 1)
-            self.performance_metrics["success_rate"] = (current_success + 1) / self.performance_metrics["tasks_completed"]
-            
-            # Update average response time
-            current_avg_time = self.performance_metrics["avg_response_time"]
-            self.performance_metrics["avg_response_time"] = (
-                (current_avg_time * (self.performance_metrics["tasks_completed"] - 1) + processing_time) / 
-                self.performance_metrics["tasks_completed"]
-            )
+            metrics["success_rate"] += (1.0 - metrics["success_rate"]) / completed
+            metrics["avg_response_time"] += (processing_time - metrics["avg_response_time"]) / completed
         else:
-            # Update error count and success rate
-            self.performance_metrics["errors"] += 1
-            current_success = self.performance_metrics["success_rate"] * (self.performance_metrics["tasks_completed"] - 1)
-            self.performance_metrics["success_rate"] = current_success / self.performance_metrics["tasks_completed"]
+            metrics["errors"] += 1
+            metrics["success_rate"] -= metrics["success_rate"] / completed
     
     async def send_message(self, message: AgentMessage) -> Optional[AgentMessage]:
         """Send message through orchestrator"""
@@ -215,13 +212,14 @@ class BaseAgent(ABC):
     
     async def collaborate_with_agent(self, target_agent_id: str, request: Dict[str, Any]) -> Dict[str, Any]:
         """Request collaboration with another agent"""
+        now = datetime.now()
         message = AgentMessage(
-            id=f"collab_{datetime.now().timestamp()}",
+            id=f"collab_{now.timestamp()}",
             sender_id=self.agent_id,
             recipient_id=target_agent_id,
             message_type=MessageType.COLLABORATION,
             content=request,
-            timestamp=datetime.now()
+            timestamp=now
         )
         
         response = await self.send_message(message)
@@ -231,13 +229,14 @@ class BaseAgent(ABC):
     
     async def request_data_from_agent(self, target_agent_id: str, data_request: Dict[str, Any]) -> Dict[str, Any]:
         """Request data from another agent"""
+        now = datetime.now()
         message = AgentMessage(
-            id=f"data_req_{datetime.now().timestamp()}",
+            id=f"data_req_{now.timestamp()}",
             sender_id=self.agent_id,
             recipient_id=target_agent_id,
             message_type=MessageType.DATA_REQUEST,
             content=data_request,
-            timestamp=datetime.now()
+            timestamp=now
         )
         
         response = await self.send_message(message)
@@ -259,7 +258,7 @@ class BaseAgent(ABC):
     
     def add_to_cache(self, key: str, data: Any, ttl: Optional[int] = None) -> None:
         """Add data to agent cache with TTL"""
-        expiry = datetime.now().timestamp() + (ttl if ttl is not None else self.cache_ttl)
+        expiry = time.monotonic() + (ttl if ttl is not None else self.cache_ttl)
         self.cache[key] = {
             "data": data,
             "expiry": expiry
@@ -271,7 +270,7 @@ class BaseAgent(ABC):
             return None
         
         cache_item = self.cache[key]
-        if datetime.now().timestamp() > cache_item["expiry"]:
+        if time.monotonic() > cache_item["expiry"]:
             # Cache expired
             del self.cache[key]
             return None
@@ -292,8 +291,18 @@ class AgentOrchestrator:
         self.workflow_templates: Dict[str, Dict] = {}
         self.event_listeners: Dict[str, List[Callable]] = {}
         self.global_context: Dict[str, Any] = {}
-        self.message_history: List[AgentMessage] = []
-        self.max_history_size: int = 1000
+        # Bounded log: appends past the limit drop the oldest entry in O(1)
+        self.message_history: Deque[AgentMessage] = deque(maxlen=1000)
+    
+    @property
+    def max_history_size(self) -> int:
+        """Maximum number of messages kept in message_history"""
+        return self.message_history.maxlen
+    
+    @max_history_size.setter
+    def max_history_size(self, size: int) -> None:
+        # A deque's maxlen is fixed, so resizing rebuilds it, keeping the newest entries
+        self.message_history = deque(self.message_history, maxlen=size)
     
     def register_agent(self, agent: BaseAgent):
         """Register an agent with the orchestrator"""
@@ -340,8 +349,6 @@ class AgentOrchestrator:
     def _add_to_message_history(self, message: AgentMessage) -> None:
         """Add message to history with size limit"""
         self.message_history.append(message)
-        if len(self.message_history) > self.max_history_size:
-            self.message_history = self.message_history[-self.max_history_size:]
     
     def register_event_listener(self, event_name: str, callback: Callable) -> None:
         """Register event listener for a specific event"""
@@ -466,7 +473,7 @@ class AgentOrchestrator:
     def get_message_history(self, limit: int = 50, message_type: Optional[MessageType] = None,
                            agent_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get message history with optional filtering"""
-        filtered_history = self.message_history
+        filtered_history = list(self.message_history)
         
         if message_type:
             filtered_history = [m for m in filtered_history if m.message_type == message_type]
@@ -1,8 +1,9 @@
 import ast
 import re
 import difflib
+import os
+from collections import Counter
 from typing import Dict, List, Any, Optional, Set, Tuple
-from pathlib import Path
 import logging
 from dataclasses import dataclass
 from enum import Enum
@@ -12,13 +13,49 @@ from .utils.file_analyzer import FileAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# Built once at import; _detect_language runs for every file in a repo walk
+LANGUAGE_BY_EXTENSION: Dict[str, str] = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.jsx': 'javascript',
+    '.ts': 'typescript',
+    '.tsx': 'typescript',
+    '.java': 'java',
+    '.cpp': 'cpp',
+    '.c': 'c',
+    '.cs': 'csharp',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.php': 'php',
+    '.rb': 'ruby',
+    '.kt': 'kotlin',
+    '.swift': 'swift'
+}
+
+# Per-line patterns, compiled once; where the match implies a literal substring,
+# callers test that first so most lines never reach the regex engine
+_JS_LOOSE_EQUALITY = re.compile(r'[^=!]==[^=]')
+_JS_FUNCTION_DEF = re.compile(r'function\s+\w+|const\s+\w+\s*=.*=>')
+_JAVA_METHOD_DEF = re.compile(r'(public|private|protected).*\s+\w+\s*\(.*\)\s*{')
+_JAVA_CLASS_DEF = re.compile(r'(public\s+)?class\s+\w+')
+_PY_MUTABLE_DEFAULT = re.compile(r'def\s+\w+\([^)]*=\s*(\[\]|\{\})')
+_DIFF_HUNK_NEW_START = re.compile(r'\+(\d+)')
+
 class ReviewSeverity(str, Enum):
     INFO = "info"
     WARNING = "warning"
     ERROR = "error"
     CRITICAL = "critical"
 
-@dataclass 
+# Quality-score deduction per issue, looked up once per issue
+_SEVERITY_PENALTY: Dict[ReviewSeverity, int] = {
+    ReviewSeverity.CRITICAL: 20,
+    ReviewSeverity.ERROR: 10,
+    ReviewSeverity.WARNING: 5,
+    ReviewSeverity.INFO: 1
+}
+
+@dataclass(slots=True)
 class CodeIssue:
     """Represents a code review issue"""
     file_path: str
@@ -193,6 +230,7 @@ class CodeReviewAgent(BaseAgent):
         
         # Generate high-level suggestions
         all_suggestions = self._generate_review_suggestions(all_issues, context)
+        severity_counts = Counter(issue.severity for issue in all_issues)
         
         return {
             "issues": [self._issue_to_dict(issue) for issue in all_issues],
@@ -201,9 +239,9 @@ class CodeReviewAgent(BaseAgent):
             "metrics": {
                 "files_reviewed": files_reviewed,
                 "total_issues": len(all_issues),
-                "critical_issues": len([i for i in all_issues if i.severity == ReviewSeverity.CRITICAL]),
-                "error_issues": len([i for i in all_issues if i.severity == ReviewSeverity.ERROR]),
-                "warning_issues": len([i for i in all_issues if i.severity == ReviewSeverity.WARNING])
+                "critical_issues": severity_counts[ReviewSeverity.CRITICAL],
+                "error_issues": severity_counts[ReviewSeverity.ERROR],
+                "warning_issues": severity_counts[ReviewSeverity.WARNING]
             }
         }
     
@@ -363,7 +401,7 @@ class CodeReviewAgent(BaseAgent):
                 ))
             
             # Check for == instead of ===
-            if re.search(r'[^=!]==[^=]', line_stripped):
+            if '==' in line_stripped and _JS_LOOSE_EQUALITY.search(line_stripped):
                 issues.append(CodeIssue(
                     file_path=file_path,
                     line_number=i,
@@ -377,7 +415,7 @@ class CodeReviewAgent(BaseAgent):
                 ))
             
             # Count functions
-            if re.search(r'function\s+\w+|const\s+\w+\s*=.*=>', line_stripped):
+            if _JS_FUNCTION_DEF.search(line_stripped):
                 metrics["functions"] += 1
             
             # Count classes
@@ -420,11 +458,11 @@ class CodeReviewAgent(BaseAgent):
                 ))
             
             # Count methods
-            if re.search(r'(public|private|protected).*\s+\w+\s*\(.*\)\s*{', line_stripped):
+            if '(' in line_stripped and _JAVA_METHOD_DEF.search(line_stripped):
                 metrics["methods"] += 1
             
             # Count classes
-            if re.search(r'(public\s+)?class\s+\w+', line_stripped):
+            if 'class' in line_stripped and _JAVA_CLASS_DEF.search(line_stripped):
                 metrics["classes"] += 1
             
             # Count complexity
@@ -480,7 +518,7 @@ class CodeReviewAgent(BaseAgent):
                 ))
             
             # Check for mutable default arguments
-            if re.search(r'def\s+\w+\([^)]*=\s*(\[\]|\{\})', line_stripped):
+            if 'def' in line_stripped and _PY_MUTABLE_DEFAULT.search(line_stripped):
                 issues.append(CodeIssue(
                     file_path=file_path,
                     line_number=i,
@@ -510,7 +548,7 @@ class CodeReviewAgent(BaseAgent):
         for line in diff:
             if line.startswith('@@'):
                 # Parse line number from diff header
-                match = re.search(r'\+(\d+)', line)
+                match = _DIFF_HUNK_NEW_START.search(line)
                 if match:
                     line_number = int(match.group(1))
             elif line.startswith('+') and not line.startswith('+++'):
@@ -612,15 +650,7 @@ class CodeReviewAgent(BaseAgent):
         base_score = 100.0
         
         # Deduct points for issues
-        for issue in issues:
-            if issue.severity == ReviewSeverity.CRITICAL:
-                base_score -= 20
-            elif issue.severity == ReviewSeverity.ERROR:
-                base_score -= 10
-            elif issue.severity == ReviewSeverity.WARNING:
-                base_score -= 5
-            elif issue.severity == ReviewSeverity.INFO:
-                base_score -= 1
+        base_score -= sum(_SEVERITY_PENALTY.get(issue.severity, 0) for issue in issues)
         
         # Bonus for good metrics
         if metrics.get("docstring_coverage", 0) > 80:
@@ -635,9 +665,7 @@ class CodeReviewAgent(BaseAgent):
         """Generate high-level suggestions based on issues"""
         suggestions = []
         
-        issue_counts = {}
-        for issue in issues:
-            issue_counts[issue.category] = issue_counts.get(issue.category, 0) + 1
+        issue_counts = Counter(issue.category for issue in issues)
         
         # Generate suggestions based on issue patterns
         if issue_counts.get("documentation", 0) > 3:
@@ -656,27 +684,11 @@ class CodeReviewAgent(BaseAgent):
     
     def _detect_language(self, file_path: str) -> Optional[str]:
         """Detect programming language from file extension"""
-        ext = Path(file_path).suffix.lower()
-        
-        language_map = {
-            '.py': 'python',
-            '.js': 'javascript', 
-            '.jsx': 'javascript',
-            '.ts': 'typescript',
-            '.tsx': 'typescript',
-            '.java': 'java',
-            '.cpp': 'cpp',
-            '.c': 'c',
-            '.cs': 'csharp',
-            '.go': 'go',
-            '.rs': 'rust',
-            '.php': 'php',
-            '.rb': 'ruby',
-            '.kt': 'kotlin',
-            '.swift': 'swift'
-        }
-        
-        return language_map.get(ext)
+        name = os.path.basename(file_path)
+        dot = name.rfind('.')
+        if dot <= 0:
+            return None
+        return LANGUAGE_BY_EXTENSION.get(name[dot:].lower())
     
     def _issue_to_dict(self, issue: CodeIssue) -> Dict[str, Any]:
         """Convert CodeIssue to dictionary for JSON serialization"""
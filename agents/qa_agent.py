@@ -17,6 +17,9 @@ from .base_agent import BaseAgent, AgentCapability, TaskResult
 
 logger = logging.getLogger(__name__)
 
+# Word tokenizer for question similarity, compiled once
+_WORD_PATTERN = re.compile(r'\b\w+\b')
+
 class QAAgent(BaseAgent):
     """
     Agent responsible for answering user questions in real-time, providing
@@ -377,11 +380,12 @@ class QAAgent(BaseAgent):
         # In a real system, this would use semantic similarity
         
         # Extract key terms
-        terms = set(re.findall(r'\b\w+\b', question.lower()))
+        terms = set(_WORD_PATTERN.findall(question.lower()))
         
-        # Check cached questions for similarity
-        for cached_q, cached_data in self.answer_cache.items():
-            cached_terms = set(re.findall(r'\b\w+\b', cached_q.lower()))
+        # Check cached questions for similarity; their terms are tokenized
+        # once in _cache_answer rather than on every lookup
+        for cached_data in self.answer_cache.values():
+            cached_terms = cached_data["terms"]
             
             # Check if languages match and if there's significant term overlap
             if (not language or cached_data.get("language") == language) and \
@@ -403,6 +407,7 @@ class QAAgent(BaseAgent):
         self.answer_cache[question] = {
             "data": result,
             "language": language,
+            "terms": frozenset(_WORD_PATTERN.findall(question.lower())),
             "timestamp": asyncio.get_event_loop().time()
         }
         
@@ -1,14 +1,12 @@
 import os
+import re
 import json
+import asyncio
 import zipfile
-import rarfile
 import tempfile
 import shutil
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Set
-from git import Repo, GitCommandError
-from github import Github
-import requests
 from collections import defaultdict
 import ast
 import logging
@@ -20,6 +18,34 @@ from .utils.dependency_analyzer import DependencyAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# Extension -> language table, shared read-only by every analyzer instance
+PROGRAMMING_LANGUAGES: Dict[str, str] = {
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.java': 'Java',
+    '.cpp': 'C++',
+    '.c': 'C',
+    '.cs': 'C#',
+    '.go': 'Go',
+    '.rs': 'Rust',
+    '.php': 'PHP',
+    '.rb': 'Ruby',
+    '.kt': 'Kotlin',
+    '.swift': 'Swift',
+    '.scala': 'Scala'
+}
+
+# Directories never descended into when scanning source files
+SKIPPED_DIRS = frozenset({'node_modules', '__pycache__', 'venv', '.git'})
+
+# owner/name from https or ssh GitHub URLs; anchored so only github.com itself
+# matches, and only a trailing .git is dropped
+_GITHUB_REPO_URL = re.compile(
+    r'^(?:https?://(?:www\.)?github\.com/|git@github\.com:)'
+    r'(?P<owner>[^/]+)/(?P<name>[^/?#]+?)(?:\.git)?/?$'
+)
+
 class RepositoryAnalysisAgent(BaseAgent):
     """Agent responsible for analyzing repository structure, dependencies, and codebase"""
     
@@ -32,22 +58,7 @@ class RepositoryAnalysisAgent(BaseAgent):
         self.file_analyzer = FileAnalyzer()
         self.dependency_analyzer = DependencyAnalyzer()
         self.supported_archives = {'.zip', '.rar', '.tar', '.tar.gz', '.tgz'}
-        self.programming_languages = {
-            '.py': 'Python',
-            '.js': 'JavaScript',
-            '.ts': 'TypeScript',
-            '.java': 'Java',
-            '.cpp': 'C++',
-            '.c': 'C',
-            '.cs': 'C#',
-            '.go': 'Go',
-            '.rs': 'Rust',
-            '.php': 'PHP',
-            '.rb': 'Ruby',
-            '.kt': 'Kotlin',
-            '.swift': 'Swift',
-            '.scala': 'Scala'
-        }
+        self.programming_languages = PROGRAMMING_LANGUAGES
     
     async def initialize(self):
         """Initialize the repository analysis agent"""
@@ -135,13 +146,16 @@ class RepositoryAnalysisAgent(BaseAgent):
     async def _analyze_github_repo(self, repo_url: str, access_token: Optional[str] = None) -> Dict[str, Any]:
         """Analyze a GitHub repository"""
         try:
+            # Deferred: GitPython and PyGithub are only needed for this task type
+            from git import Repo
+            from github import Github
+            
             # Parse repository URL
-            if "github.com" not in repo_url:
+            match = _GITHUB_REPO_URL.match(repo_url.strip())
+            if not match:
                 raise ValueError("Invalid GitHub repository URL")
             
-            parts = repo_url.rstrip('/').split('/')
-            owner = parts[-2]
-            repo_name = parts[-1].replace('.git', '')
+            owner, repo_name = match.group('owner', 'name')
             
             # Initialize GitHub client
             github_client = Github(access_token) if access_token else Github()
@@ -181,7 +195,7 @@ class RepositoryAnalysisAgent(BaseAgent):
                 
             finally:
                 # Clean up temporary directory
-                shutil.rmtree(temp_dir, ignore_errors=True)
+                await asyncio.to_thread(shutil.rmtree, temp_dir, ignore_errors=True)
                 
         except Exception as e:
             logger.error(f"Error analyzing GitHub repository: {e}")
@@ -193,12 +207,12 @@ class RepositoryAnalysisAgent(BaseAgent):
         
         try:
             # Extract archive
+            # Extraction and cleanup are bulk disk I/O; run them in a worker
+            # thread so the event loop isn't blocked for the whole archive
             if archive_type.lower() in ['.zip']:
-                with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                    zip_ref.extractall(temp_dir)
+                await asyncio.to_thread(self._extract_zip, file_path, temp_dir)
             elif archive_type.lower() in ['.rar']:
-                with rarfile.RarFile(file_path, 'r') as rar_ref:
-                    rar_ref.extractall(temp_dir)
+                await asyncio.to_thread(self._extract_rar, file_path, temp_dir)
             else:
                 raise ValueError(f"Unsupported archive type: {archive_type}")
             
@@ -214,7 +228,20 @@ class RepositoryAnalysisAgent(BaseAgent):
             
         finally:
             # Clean up temporary directory
-            shutil.rmtree(temp_dir, ignore_errors=True)
+            await asyncio.to_thread(shutil.rmtree, temp_dir, ignore_errors=True)
+
+    @staticmethod
+    def _extract_zip(file_path: str, target_dir: str) -> None:
+        """Extract a ZIP archive into target_dir"""
+        with zipfile.ZipFile(file_path, 'r') as zip_ref:
+            zip_ref.extractall(target_dir)
+
+    @staticmethod
+    def _extract_rar(file_path: str, target_dir: str) -> None:
+        """Extract a RAR archive into target_dir"""
+        import rarfile
+        with rarfile.RarFile(file_path, 'r') as rar_ref:
+            rar_ref.extractall(target_dir)
     
     async def _analyze_local_repository(self, repo_path: str) -> Dict[str, Any]:
         """Analyze a local repository"""
@@ -316,7 +343,7 @@ class RepositoryAnalysisAgent(BaseAgent):
         
         for root, dirs, files in os.walk(repo_path):
             # Skip hidden directories and common build/cache directories
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', '__pycache__', 'venv', '.git']]
+            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in SKIPPED_DIRS]
             
             for file in files:
                 file_path = os.path.join(root, file)
@@ -353,19 +380,19 @@ class RepositoryAnalysisAgent(BaseAgent):
         """Count lines of code per language (simple heuristic)"""
         line_counts: Dict[str, int] = defaultdict(int)
         total_lines = 0
-        extensions_map = {ext: lang for ext, lang in self.programming_languages.items()}
+        extensions_map = self.programming_languages
 
         for root, dirs, files in os.walk(repo_path):
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', '__pycache__', 'venv', '.git']]
+            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in SKIPPED_DIRS]
             for file in files:
                 ext = Path(file).suffix.lower()
                 if ext in extensions_map:
                     file_path = os.path.join(root, file)
                     try:
                         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            # Basic line counting ignoring very long binary-looking lines
-                            lines = [ln for ln in f.readlines() if ln.strip() and len(ln) < 10000]
-                            count = len(lines)
+                            # Basic line counting ignoring very long binary-looking lines.
+                            # Iterate the file lazily so large sources are never held in memory.
+                            count = sum(1 for ln in f if ln.strip() and len(ln) < 10000)
                             line_counts[extensions_map[ext]] += count
                             total_lines += count
                     except Exception:
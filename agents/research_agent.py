@@ -10,8 +10,8 @@ import re
 import json
 import aiohttp
 import asyncio
+import time
 from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime
 import logging
 
 from .base_agent import BaseAgent, AgentCapability, TaskResult
@@ -476,7 +476,7 @@ class ResearchAgent(BaseAgent):
         if key in self.search_cache:
             cached_item = self.search_cache[key]
             cache_time = cached_item["timestamp"]
-            current_time = datetime.now().timestamp()
+            current_time = time.monotonic()
             
             # Check if cache is still valid
             if current_time - cache_time < self.cache_expiry:
@@ -488,7 +488,7 @@ class ResearchAgent(BaseAgent):
         """Add result to cache with current timestamp"""
         self.search_cache[key] = {
             "data": data,
-            "timestamp": datetime.now().timestamp()
+            "timestamp": time.monotonic()
         }
         
         # Prune cache if it gets too large (simple implementation)
@@ -1,16 +1,18 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from typing import Dict, Any
+import asyncio
+import importlib.util
 import uuid
+from itertools import islice
 import logging
 import tempfile
 import shutil
 import os
-from git import Repo
 
 # It's better to place schemas in a separate file, but for simplicity here, we define them.
 # In your project, you'd use `from app.schemas import ...`
 from pydantic import BaseModel
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set
 
 class AnalysisRequest(BaseModel):
     repo_url: str
@@ -45,9 +47,34 @@ except ImportError as e:
     logger.info("Make sure the project root is in Python path")
     raise
 
+# GitPython itself is imported lazily in start_analysis, but the endpoints are
+# useless without it. Check for it here without importing it, so main.py still
+# falls back to basic endpoints when it is missing.
+if importlib.util.find_spec("git") is None:
+    logger.error("GitPython is not installed; analysis endpoints are unavailable")
+    raise ImportError("GitPython is required for the analysis endpoints")
+
 # In-memory storage for analysis sessions
 analysis_store: Dict[str, Dict[str, Any]] = {}
 
+# Per-file size limit for agent runs; larger files are usually generated or
+# minified bundles and are skipped rather than cut off mid-source, which would
+# make the AST checks report false syntax errors
+MAX_FILE_SIZE_BYTES = 256 * 1024
+
+# Agents whose output depends only on the cloned snapshot; the clone never
+# changes after start_analysis, so their results are kept per session
+SNAPSHOT_AGENT_IDS = frozenset({"code_reviewer", "security_scan", "qa_agent"})
+
+# Caps clones in flight so a burst of /analyze calls can't take over the
+# default thread pool and network; extra requests wait for a free slot
+MAX_CONCURRENT_CLONES = 4
+_clone_slots = asyncio.Semaphore(MAX_CONCURRENT_CLONES)
+
+# Clones still running after their request was cancelled; held here so the
+# task isn't garbage-collected before its deferred cleanup runs
+_orphaned_clones: Set[asyncio.Task] = set()
+
 # Instantiate agents
 repo_analyzer = RepositoryAnalysisAgent()
 code_reviewer = CodeReviewAgent()
@@ -76,46 +103,111 @@ AVAILABLE_AGENTS_MAP = {
     },
 }
 
+# The agent roster is fixed at import, so validate it once and share it
+AVAILABLE_AGENTS: List[AvailableAgent] = [
+    AvailableAgent(name=agent["instance"].name, description=agent["description"], agent_id=agent_id)
+    for agent_id, agent in AVAILABLE_AGENTS_MAP.items()
+]
+
+def _iter_repo_files(repo_path: str):
+    """Yield file paths under repo_path in os.walk order, skipping git internals."""
+    for root, dirs, files in os.walk(repo_path):
+        if ".git" in root: continue
+        # Prune here too so the walk never descends into .git object stores
+        dirs[:] = [d for d in dirs if ".git" not in d]
+        for file in files:
+            yield os.path.join(root, file)
+
+async def _clone_repository(clone_from, repo_url: str, target_dir: str) -> None:
+    """Clone in a worker thread, holding a clone slot until git has exited."""
+    async with _clone_slots:
+        await asyncio.to_thread(clone_from, repo_url, target_dir)
+
+def _cleanup_orphaned_clone(task: asyncio.Task, target_dir: str) -> None:
+    """Done-callback for a clone whose request was cancelled: remove its directory."""
+    _orphaned_clones.discard(task)
+    if not task.cancelled():
+        task.exception()  # retrieve it so a failed clone isn't reported as unhandled
+    shutil.rmtree(target_dir, ignore_errors=True)
+
 @router.post("/analyze", response_model=InitialAnalysisResponse)
 async def start_analysis(request: AnalysisRequest):
     """
     Accepts a GitHub repository URL, clones it, performs an initial analysis,
     and returns an analysis ID with available agents for further actions.
     """
+    # Imported here so app startup doesn't pay for GitPython's import and
+    # git executable probe until a clone is actually requested
+    try:
+        from git import Repo
+        from git.exc import GitError
+    except ImportError as e:
+        # Also raised by GitPython itself when no git executable is found
+        logger.error(f"GitPython unavailable: {e}")
+        raise HTTPException(status_code=503, detail=f"Repository cloning is unavailable: {e}") from e
+
     analysis_id = str(uuid.uuid4())
     temp_dir = tempfile.mkdtemp(prefix="sensei_")
     logger.info(f"Starting analysis for {request.repo_url} with ID: {analysis_id}")
 
+    cleanup_deferred = False
     try:
-        logger.info(f"Cloning {request.repo_url} into {temp_dir}")
-        Repo.clone_from(request.repo_url, temp_dir)
+        try:
+            logger.info(f"Cloning {request.repo_url} into {temp_dir}")
+            # A clone can take seconds to minutes; it runs in a worker thread so
+            # other requests keep being served. That thread can't be interrupted,
+            # so the clone task is shielded: if this request is cancelled it keeps
+            # running (and keeps its clone slot) and temp_dir is removed only
+            # once git has exited.
+            clone = asyncio.create_task(_clone_repository(Repo.clone_from, request.repo_url, temp_dir))
+            try:
+                await asyncio.shield(clone)
+            except asyncio.CancelledError:
+                if not clone.done():
+                    cleanup_deferred = True
+                    _orphaned_clones.add(clone)
+                    clone.add_done_callback(lambda task: _cleanup_orphaned_clone(task, temp_dir))
+                raise
+        except GitError as e:
+            # Base class: also covers UnsafeProtocolError, UnsafeOptionError
+            # and GitCommandNotFound, which don't subclass GitCommandError
+            logger.error(f"Failed to clone {request.repo_url}: {e}")
+            raise HTTPException(status_code=400, detail=f"Failed to clone repository: {e}") from e
 
-        initial_result = await repo_analyzer._analyze_local_repository(temp_dir)
+        try:
+            initial_result = await repo_analyzer._analyze_local_repository(temp_dir)
+        except Exception as e:
+            logger.error(f"Failed initial analysis for {request.repo_url}: {e}", exc_info=True)
+            raise HTTPException(status_code=500, detail=f"Failed to analyze repository: {e}") from e
 
         analysis_store[analysis_id] = {
             "repo_url": request.repo_url,
             "local_path": temp_dir,
-            "initial_summary": initial_result
+            "initial_summary": initial_result,
+            "agent_results": {}
         }
+    except Exception:
+        await asyncio.to_thread(shutil.rmtree, temp_dir, ignore_errors=True)
+        raise
+    except BaseException:
+        # Cancellation: another await could be interrupted, so remove synchronously,
+        # unless a still-running clone owns the cleanup
+        if not cleanup_deferred:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
 
-        available_agents = [
-            AvailableAgent(name=agent["instance"].name, description=agent["description"], agent_id=agent_id)
-            for agent_id, agent in AVAILABLE_AGENTS_MAP.items()
-        ]
-
-        return InitialAnalysisResponse(
-            analysis_id=analysis_id,
-            repo_url=request.repo_url,
-            message="Initial analysis complete. Select an agent for deeper insights.",
-            available_agents=available_agents,
-            initial_summary=initial_result
-        )
-    except Exception as e:
-        logger.error(f"Failed initial analysis for {request.repo_url}: {e}", exc_info=True)
-        shutil.rmtree(temp_dir, ignore_errors=True)
-        if analysis_id in analysis_store:
-            del analysis_store[analysis_id]
-        raise HTTPException(status_code=500, detail=f"Failed to analyze repository: {e}")
+    # Fields are server-built and already typed; skip per-request validation.
+    # Returning a Response also bypasses FastAPI's response_model check, which
+    # stays on the decorator only for the OpenAPI schema. model_dump_json
+    # encodes straight to bytes in one pass, with no intermediate dict.
+    response = InitialAnalysisResponse.model_construct(
+        analysis_id=analysis_id,
+        repo_url=request.repo_url,
+        message="Initial analysis complete. Select an agent for deeper insights.",
+        available_agents=AVAILABLE_AGENTS,
+        initial_summary=initial_result
+    )
+    return Response(response.model_dump_json(), media_type="application/json")
 
 @router.post("/analyze/{analysis_id}/{agent_id}", response_model=AgentAnalysisResponse)
 async def run_agent_analysis(analysis_id: str, agent_id: str):
@@ -135,18 +227,20 @@ async def run_agent_analysis(analysis_id: str, agent_id: str):
     agent_instance = AVAILABLE_AGENTS_MAP[agent_id]["instance"]
     logger.info(f"Running agent '{agent_id}' on analysis '{analysis_id}'")
 
+    agent_results = analysis_session.setdefault("agent_results", {})
+
     try:
         task_result = {}
-        if agent_id == "repo_analyzer":
+        if agent_id in agent_results:
+            task_result = agent_results[agent_id]
+        elif agent_id == "repo_analyzer":
             task_result = analysis_session["initial_summary"]
         elif agent_id in ["code_reviewer", "security_scan"]:
-            all_files, file_results = [], []
-            for root, _, files in os.walk(local_repo_path):
-                if ".git" in root: continue
-                for file in files: all_files.append(os.path.join(root, file))
-            
-            for file_path in all_files[:20]: # Limit for demo
+            file_results = []
+            # Walk lazily and stop at the limit instead of listing the whole repo first
+            for file_path in islice(_iter_repo_files(local_repo_path), 20): # Limit for demo
                  try:
+                     if os.path.getsize(file_path) > MAX_FILE_SIZE_BYTES: continue
                      with open(file_path, 'r', encoding='utf-8', errors='ignore') as f: content = f.read()
                      lang = agent_instance._detect_language(file_path)
                      if lang: file_results.append(await agent_instance._analyze_file_quality(file_path, content, lang))
@@ -155,35 +249,14 @@ async def run_agent_analysis(analysis_id: str, agent_id: str):
         elif agent_id == "qa_agent":
             sample_code, sample_lang, sample_file_path = "", "", "No suitable file found"
             
-            # Simple language detection function
-            def detect_language(file_path: str) -> str:
-                ext = os.path.splitext(file_path)[1].lower()
-                language_map = {
-                    '.py': 'python',
-                    '.js': 'javascript', 
-                    '.jsx': 'javascript',
-                    '.ts': 'typescript',
-                    '.tsx': 'typescript',
-                    '.java': 'java',
-                    '.cpp': 'cpp',
-                    '.c': 'c',
-                    '.cs': 'csharp',
-                    '.go': 'go',
-                    '.rs': 'rust',
-                    '.php': 'php',
-                    '.rb': 'ruby',
-                    '.kt': 'kotlin',
-                    '.swift': 'swift'
-                }
-                return language_map.get(ext, 'unknown')
-            
             for root, _, files in os.walk(local_repo_path):
                  if ".git" in root: continue
                  for file in files:
                      if file.endswith((".py", ".js", ".ts")):
                          sample_file_path = os.path.join(root, file)
+                         if os.path.getsize(sample_file_path) > MAX_FILE_SIZE_BYTES: continue
                          with open(sample_file_path, 'r', encoding='utf-8') as f: sample_code = f.read()
-                         sample_lang = detect_language(sample_file_path)
+                         sample_lang = code_reviewer._detect_language(sample_file_path) or 'unknown'
                          break
                  if sample_code: break
             
@@ -203,7 +276,11 @@ async def run_agent_analysis(analysis_id: str, agent_id: str):
         else:
             task_result = {"message": f"No specific handling implemented for agent: {agent_id}"}
 
-        return AgentAnalysisResponse(analysis_id=analysis_id, agent_id=agent_id, status="completed", result=task_result)
+        if agent_id in SNAPSHOT_AGENT_IDS:
+            agent_results[agent_id] = task_result
+
+        response = AgentAnalysisResponse.model_construct(analysis_id=analysis_id, agent_id=agent_id, status="completed", result=task_result)
+        return Response(response.model_dump_json(), media_type="application/json")
     except Exception as e:
         logger.error(f"Agent '{agent_id}' failed: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Agent analysis failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Agent analysis failed: {e}") from e
@@ -1,10 +1,13 @@
 """
 FastAPI main application - simplified version.
 """
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Tuple
 import logging
+import orjson
 import time
 import sys
 import os
@@ -14,7 +17,8 @@ from pathlib import Path
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Basic settings class
+# Basic settings class, loaded once and read-only afterwards
+@dataclass(frozen=True, slots=True)
 class Settings:
     app_name: str = "OpenSource Sensei API"
     app_version: str = "1.0.0"
@@ -22,7 +26,7 @@ class Settings:
     host: str = "0.0.0.0"
     port: int = 8000
     debug: bool = True
-    cors_origins: list = ["*"]
+    cors_origins: Tuple[str, ...] = ("*",)
     persistence_mode: str = "memory"
     disable_database: bool = True
 
@@ -68,14 +72,35 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+class ProcessTimeMiddleware:
+    """Pure ASGI middleware that adds an X-Process-Time header (seconds).
+
+    Unlike @app.middleware("http"), this doesn't wrap each request in
+    BaseHTTPMiddleware's extra task and response streaming; it only stamps
+    the header onto the response-start message.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter_ns()
+
+        async def send_with_process_time(message):
+            if message["type"] == "http.response.start":
+                elapsed = (time.perf_counter_ns() - start) / 1e9
+                message["headers"] = [*message.get("headers", ()), (b"x-process-time", b"%.6f" % elapsed)]
+            await send(message)
+
+        await self.app(scope, receive, send_with_process_time)
+
+
 # Add request timing middleware
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
-    return response
+app.add_middleware(ProcessTimeMiddleware)
 
 # Include analysis endpoints if available
 try:
@@ -87,37 +112,35 @@ except ImportError as e:
     logger.info("Running with basic endpoints only")
 
 
+# Neither payload changes while the process runs (memory mode, static
+# settings), so both are encoded once and served as raw bytes
+_ROOT_BODY = orjson.dumps({
+    "message": "OpenSource Sensei API",
+    "version": settings.app_version,
+    "status": "running",
+    "persistence_mode": settings.persistence_mode,
+})
+
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "database": "disabled",
+    "database_required": False,
+    "persistence_mode": settings.persistence_mode,
+    "version": settings.app_version,
+    "environment": "development"
+})
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
-    return {
-        "message": "OpenSource Sensei API",
-        "version": settings.app_version,
-        "status": "running",
-        "persistence_mode": settings.persistence_mode,
-    }
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    try:
-        return {
-            "status": "healthy",
-            "database": "disabled",
-            "database_required": False,
-            "persistence_mode": settings.persistence_mode,
-            "version": settings.app_version,
-            "environment": "development"
-        }
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return {
-            "status": "degraded",
-            "database": "disabled", 
-            "error": str(e),
-            "version": settings.app_version
-        }
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@ import os
 import tempfile
 import asyncio
 import json
-from agents.repository_analyzer import RepositoryAnalysisAgent
+from agents.repository_analyzer import RepositoryAnalysisAgent, _GITHUB_REPO_URL
 
 async def run_analysis(path: str):
     agent = RepositoryAnalysisAgent()
@@ -10,6 +10,8 @@ async def run_analysis(path: str):
 
 def test_project_type_detection_node_and_python():
     tmp = tempfile.mkdtemp(prefix="sensei_test_")
+    # One loop for both analyses instead of an asyncio.run() setup/teardown each
+    loop = asyncio.new_event_loop()
     try:
         # Node.js sentinel
         with open(os.path.join(tmp, 'package.json'), 'w', encoding='utf-8') as f:
@@ -18,7 +20,7 @@ def test_project_type_detection_node_and_python():
         with open(os.path.join(tmp, 'index.js'), 'w', encoding='utf-8') as f:
             f.write('console.log("hello");')
 
-        result = asyncio.run(run_analysis(tmp))
+        result = loop.run_until_complete(run_analysis(tmp))
         assert result['metadata']['project_type'] == 'Node.js'
         assert 'total_lines' in result['languages']
 
@@ -29,13 +31,37 @@ def test_project_type_detection_node_and_python():
         with open(os.path.join(tmp, 'app.py'), 'w', encoding='utf-8') as f:
             f.write('print("hi")\n')
 
-        result2 = asyncio.run(run_analysis(tmp))
+        result2 = loop.run_until_complete(run_analysis(tmp))
         assert result2['metadata']['project_type'] == 'Python'
     finally:
-        # Leave temp dir for debugging if needed (could clean with shutil.rmtree)
-        pass
+        # Join any to_thread workers first, as asyncio.run() does
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
+
+def test_github_repo_url_parsing():
+    accepted = {
+        'https://github.com/owner/repo': ('owner', 'repo'),
+        'https://www.github.com/owner/repo/': ('owner', 'repo'),
+        'https://github.com/owner/repo.git': ('owner', 'repo'),
+        'git@github.com:owner/repo.git': ('owner', 'repo'),
+        'https://github.com/owner/my.github.io': ('owner', 'my.github.io'),
+    }
+    for url, expected in accepted.items():
+        match = _GITHUB_REPO_URL.match(url)
+        assert match and match.group('owner', 'name') == expected, url
+
+    rejected = [
+        'https://evil.com/github.com/owner/repo',
+        'https://gitlab.com/owner/repo',
+        'https://github.com/owner/repo?tab=readme',
+        'https://github.com/owner/repo/tree/main',
+        'ext::sh -c touch% /tmp/pwned',
+    ]
+    for url in rejected:
+        assert _GITHUB_REPO_URL.match(url) is None, url
 
 if __name__ == '__main__':
     # Simple manual run
     test_project_type_detection_node_and_python()
+    test_github_repo_url_parsing()
     print('Tests passed')